@@ -3,6 +3,8 @@
 import random
 import time
 
+import numpy as np
+
 # AI Personalities with different strengths
 AI_PERSONALITIES = {
     "Ken Jennings": {
@@ -61,8 +63,8 @@ AI_DIFFICULTY = {
     }
 }
 
-def simulate_ai_response(clue, category, difficulty, personality):
-    """Simulate AI response based on difficulty and personality"""
+def get_ai_accuracy(category, difficulty, personality):
+    """Probability that an AI personality answers a clue in this category correctly"""
     personality_data = AI_PERSONALITIES[personality]
     difficulty_data = AI_DIFFICULTY[difficulty]
     
@@ -76,7 +78,12 @@ def simulate_ai_response(clue, category, difficulty, personality):
         base_accuracy -= 0.20
     
     # Apply difficulty modifier
-    final_accuracy = min(0.99, max(0.20, base_accuracy + difficulty_data["accuracy_modifier"]))
+    return min(0.99, max(0.20, base_accuracy + difficulty_data["accuracy_modifier"]))
+
+def simulate_ai_response(clue, category, difficulty, personality):
+    """Simulate AI response based on difficulty and personality"""
+    personality_data = AI_PERSONALITIES[personality]
+    final_accuracy = get_ai_accuracy(category, difficulty, personality)
     
     # Determine if AI gets it right
     is_correct = random.random() < final_accuracy
@@ -93,6 +100,15 @@ def simulate_ai_response(clue, category, difficulty, personality):
     
     return is_correct, thinking_time
 
+def simulate_ai_responses(category, difficulty, personalities):
+    """Simulate several AI players answering the same clue with one random draw
+    
+    Returns a boolean array, one entry per personality, True where that AI
+    answered correctly.
+    """
+    thresholds = np.array([get_ai_accuracy(category, difficulty, p) for p in personalities])
+    return np.random.random(len(thresholds)) < thresholds
+
 def simulate_buzzer_race(difficulty):
     """Simulate who wins the buzzer"""
     difficulty_data = AI_DIFFICULTY[difficulty]
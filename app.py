@@ -16,6 +16,7 @@ import json
 import random
 import time
 import os
+import hashlib
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
@@ -24,10 +25,17 @@ import threading
 from collections import defaultdict
 
 # Import components
-from ai_opponent import AI_PERSONALITIES, AI_DIFFICULTY, simulate_ai_response, simulate_buzzer_race, get_ai_daily_double_wager
+from ai_opponent import AI_PERSONALITIES, AI_DIFFICULTY, simulate_ai_response, simulate_ai_responses, simulate_buzzer_race, get_ai_daily_double_wager
 from firebase_auth_streamlit import firebase_auth_helper
 from jeopardy_answer_checker import JeopardyAnswerChecker
 
+# st.fragment is Streamlit 1.37+ (experimental_fragment from 1.33);
+# older versions fall back to full-script reruns
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Set by app_no_auth.py to run without the login/logout flow
+NO_AUTH = bool(os.getenv("JAYPARDY_NO_AUTH"))
+
 # Page configuration
 st.set_page_config(
     page_title="🎯 Jaypardy! - Complete Edition",
@@ -267,75 +275,128 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Load answer checker once per process
+@st.cache_resource
+def get_answer_checker() -> JeopardyAnswerChecker:
+    return JeopardyAnswerChecker()
+
+# Player scores
+class ScoreBoard:
+    """Player scores held in one NumPy array, indexed like a dict by player id"""
+    
+    MAX_PLAYERS = 8
+    
+    def __init__(self):
+        self.values = np.zeros(ScoreBoard.MAX_PLAYERS, dtype=np.int64)
+        self.index = {}
+    
+    def _slot(self, player_id: str) -> int:
+        """Get (or assign) the array slot for a player"""
+        slot = self.index.get(player_id)
+        if slot is None:
+            slot = self.index[player_id] = len(self.index)
+            if slot >= len(self.values):
+                self.values = np.concatenate([self.values, np.zeros_like(self.values)])
+        return slot
+    
+    def __getitem__(self, player_id: str) -> int:
+        slot = self._slot(player_id)
+        return int(self.values[slot])
+    
+    def __setitem__(self, player_id: str, score: int):
+        slot = self._slot(player_id)
+        self.values[slot] = score
+    
+    def add(self, player_ids: List[str], deltas: np.ndarray):
+        """Apply score changes for several players at once"""
+        slots = [self._slot(pid) for pid in player_ids]
+        self.values[slots] += deltas
+    
+    def ranking(self, player_ids: List[str]) -> List[Tuple[str, int]]:
+        """Get (player_id, score) pairs sorted from highest to lowest score"""
+        slots = [self._slot(pid) for pid in player_ids]
+        player_scores = self.values[slots]
+        order = np.argsort(-player_scores, kind='stable')
+        return [(player_ids[i], int(player_scores[i])) for i in order]
+
+# Session state defaults, applied once per session by init_session_state.
+# Mutable values are factories so every session gets its own copy.
+SESSION_DEFAULTS = {
+    # User info
+    'logged_in': False,
+    'username': None,
+    'user_id': None,
+    'auth_method': None,
+    
+    # Game modes
+    'game_mode': None,  # solo, two_player, ai_opponent, tournament
+    'game_phase': 'menu',  # menu, board, question, answer, final_jeopardy
+    
+    # Players
+    'players': dict,  # {player_id: {name, score, is_ai, personality}}
+    'current_player': None,
+    'buzzed_player': None,
+    
+    # Game state
+    'board': None,  # 6x5 grid of questions
+    'current_question': None,
+    'current_answer': None,
+    'current_value': 0,
+    'current_category': None,
+    'answered_questions': set,
+    'remaining_cells': 0,  # unanswered board cells
+    
+    # Timer
+    'timer_active': False,
+    'timer_start': None,
+    'timer_duration': 10,  # seconds
+    'buzzer_window': 5,  # seconds to buzz in
+    
+    # Scoring
+    'scores': ScoreBoard,
+    'streaks': lambda: defaultdict(int),
+    'correct_answers': lambda: defaultdict(int),
+    'total_answers': lambda: defaultdict(int),
+    
+    # Daily Double
+    'daily_doubles': list,  # positions of daily doubles
+    'is_daily_double': False,
+    'daily_double_wager': 0,
+    
+    # Final Jeopardy
+    'final_jeopardy_category': None,
+    'final_jeopardy_question': None,
+    'final_jeopardy_answer': None,
+    'final_wagers': dict,
+    'final_answers': dict,
+    'final_results_recorded': False,
+    'final_standings': list,  # [(player_id, score)], highest first
+    
+    # Tournament
+    'tournament_bracket': list,
+    'tournament_round': 0,
+    'tournament_winners': list,
+    
+    # Settings
+    'sound_enabled': True,
+    'timer_enabled': True,
+    'difficulty': 'Medium',
+    
+    # Statistics
+    'game_stats': lambda: defaultdict(lambda: defaultdict(int)),
+    'category_performance': lambda: defaultdict(lambda: defaultdict(int)),
+}
+
 # Initialize session state
 def init_session_state():
     """Initialize all session state variables"""
-    defaults = {
-        # User info
-        'logged_in': False,
-        'username': None,
-        'user_id': None,
-        'auth_method': None,
-        
-        # Game modes
-        'game_mode': None,  # solo, two_player, ai_opponent, tournament
-        'game_phase': 'menu',  # menu, board, question, answer, final_jeopardy
-        
-        # Players
-        'players': {},  # {player_id: {name, score, is_ai, personality}}
-        'current_player': None,
-        'buzzed_player': None,
-        
-        # Game state
-        'board': None,  # 6x5 grid of questions
-        'current_question': None,
-        'current_answer': None,
-        'current_value': 0,
-        'current_category': None,
-        'answered_questions': set(),
-        
-        # Timer
-        'timer_active': False,
-        'timer_start': None,
-        'timer_duration': 10,  # seconds
-        'buzzer_window': 5,  # seconds to buzz in
-        
-        # Scoring
-        'scores': defaultdict(int),
-        'streaks': defaultdict(int),
-        'correct_answers': defaultdict(int),
-        'total_answers': defaultdict(int),
-        
-        # Daily Double
-        'daily_doubles': [],  # positions of daily doubles
-        'is_daily_double': False,
-        'daily_double_wager': 0,
-        
-        # Final Jeopardy
-        'final_jeopardy_category': None,
-        'final_jeopardy_question': None,
-        'final_jeopardy_answer': None,
-        'final_wagers': {},
-        'final_answers': {},
-        
-        # Tournament
-        'tournament_bracket': [],
-        'tournament_round': 0,
-        'tournament_winners': [],
-        
-        # Settings
-        'sound_enabled': True,
-        'timer_enabled': True,
-        'difficulty': 'Medium',
-        
-        # Statistics
-        'game_stats': defaultdict(lambda: defaultdict(int)),
-        'category_performance': defaultdict(lambda: defaultdict(int)),
-    }
+    if st.session_state.get('_session_initialized'):
+        return
     
-    for key, value in defaults.items():
+    for key, value in SESSION_DEFAULTS.items():
         if key not in st.session_state:
-            st.session_state[key] = value
+            st.session_state[key] = value() if callable(value) else value
+    st.session_state._session_initialized = True
 
 # Timer functionality
 class GameTimer:
@@ -759,7 +820,7 @@ def play_question_with_buzzer(df: pd.DataFrame):
 def handle_answer(answer: str, player_id: str, timeout: bool = False, passed: bool = False):
     """Process answer and update scores"""
     
-    answer_checker = JeopardyAnswerChecker()
+    answer_checker = get_answer_checker()
     player_data = st.session_state.players[player_id]
     
     value = st.session_state.daily_double_wager if st.session_state.is_daily_double else st.session_state.current_value
@@ -815,7 +876,10 @@ def handle_answer(answer: str, player_id: str, timeout: bool = False, passed: bo
 def mark_question_answered():
     """Mark current question as answered on the board"""
     if st.session_state.board and st.session_state.current_category and st.session_state.current_value:
-        st.session_state.board[st.session_state.current_category][st.session_state.current_value]['answered'] = True
+        question = st.session_state.board[st.session_state.current_category][st.session_state.current_value]
+        if not question['answered']:
+            question['answered'] = True
+            st.session_state.remaining_cells -= 1
 
 def reset_question_state():
     """Reset question-related state"""
@@ -833,13 +897,75 @@ def check_board_complete() -> bool:
     if not st.session_state.board:
         return False
     
-    for category in st.session_state.board.values():
-        for question in category.values():
-            if not question['answered']:
-                return False
-    return True
+    return st.session_state.remaining_cells == 0
 
 # Final Jeopardy
+WINNER_TEMPLATE = (
+    '<div style="background: linear-gradient(135deg, #FFD700 0%, #FFA000 100%); '
+    'color: white; padding: 2rem; border-radius: 15px; margin: 1rem 0;">'
+    '<h2>🏆 WINNER: {name}</h2><h1>${score:,}</h1></div>'
+)
+RUNNER_UP_TEMPLATE = (
+    '<div style="background: white; border: 2px solid #060CE9; '
+    'padding: 1rem; border-radius: 10px; margin: 0.5rem 0;">'
+    '<h3>#{place} {name}: ${score:,}</h3></div>'
+)
+
+def final_wagers_complete() -> bool:
+    """Check if every player has a locked-in wager"""
+    return all(pid in st.session_state.final_wagers for pid in st.session_state.players)
+
+def final_answers_complete() -> bool:
+    """Check if every player with a wager has submitted an answer"""
+    return all(pid in st.session_state.final_answers
+               for pid, wager in st.session_state.final_wagers.items() if wager > 0)
+
+def lock_final_wager(player_id: str):
+    """Button callback: store the player's wager widget value"""
+    st.session_state.final_wagers[player_id] = st.session_state[f"final_wager_{player_id}"]
+
+def submit_final_answer(player_id: str):
+    """Button callback: store the player's answer widget value"""
+    st.session_state.final_answers[player_id] = st.session_state[f"final_answer_{player_id}"]
+
+@_fragment
+def final_wager_input(player_id: str, player_data: Dict, score: int):
+    """Wager input for one human player, rerun on its own while editing"""
+    if player_id in st.session_state.final_wagers:
+        # Locked in by the callback; advance the whole app once everyone is in
+        if final_wagers_complete():
+            st.rerun()
+        st.success(f"{player_data['name']} has locked in their wager")
+        return
+    
+    st.number_input(
+        f"{player_data['name']}'s wager (max ${score:,})",
+        min_value=0,
+        max_value=score,
+        value=min(1000, score),
+        step=100,
+        key=f"final_wager_{player_id}"
+    )
+    st.button(f"Lock in {player_data['name']}'s wager", key=f"lock_{player_id}",
+              on_click=lock_final_wager, args=(player_id,))
+
+@_fragment
+def final_answer_input(player_id: str, player_data: Dict):
+    """Answer input for one human player, rerun on its own while typing"""
+    if player_id in st.session_state.final_answers:
+        if final_answers_complete():
+            st.rerun()
+        st.success(f"{player_data['name']} has submitted their answer")
+        return
+    
+    st.text_area(
+        f"{player_data['name']}'s answer",
+        placeholder="Remember to phrase as a question!",
+        key=f"final_answer_{player_id}"
+    )
+    st.button(f"Submit {player_data['name']}'s answer", key=f"submit_{player_id}",
+              on_click=submit_final_answer, args=(player_id,))
+
 def play_final_jeopardy(df: pd.DataFrame):
     """Final Jeopardy round"""
     
@@ -870,7 +996,7 @@ def play_final_jeopardy(df: pd.DataFrame):
     """, unsafe_allow_html=True)
     
     # Wager phase
-    if not all(st.session_state.final_wagers.values()):
+    if not final_wagers_complete():
         st.markdown("### 💰 Place Your Wagers")
         
         for player_id, player_data in st.session_state.players.items():
@@ -887,18 +1013,7 @@ def play_final_jeopardy(df: pd.DataFrame):
                         st.session_state.final_wagers[player_id] = wager
                         st.info(f"{player_data['name']} has placed their wager")
                     else:
-                        wager = st.number_input(
-                            f"{player_data['name']}'s wager (max ${score:,})",
-                            min_value=0,
-                            max_value=score,
-                            value=min(1000, score),
-                            step=100,
-                            key=f"final_wager_{player_id}"
-                        )
-                        
-                        if st.button(f"Lock in {player_data['name']}'s wager", key=f"lock_{player_id}"):
-                            st.session_state.final_wagers[player_id] = wager
-                            st.rerun()
+                        final_wager_input(player_id, player_data, score)
         
         return
     
@@ -913,91 +1028,94 @@ def play_final_jeopardy(df: pd.DataFrame):
     """, unsafe_allow_html=True)
     
     # Answer phase
-    if not all(st.session_state.final_answers.values()):
+    if not final_answers_complete():
         st.markdown("### ✍️ Write Your Answers")
         
-        for player_id, player_data in st.session_state.players.items():
-            if st.session_state.final_wagers[player_id] > 0 and player_id not in st.session_state.final_answers:
-                if player_data.get('is_ai'):
-                    # AI answer
-                    is_correct, _ = simulate_ai_response(
-                        st.session_state.final_jeopardy_question,
-                        st.session_state.final_jeopardy_category,
-                        st.session_state.difficulty,
-                        player_data.get('personality', 'Balanced')
-                    )
-                    
-                    if is_correct:
-                        st.session_state.final_answers[player_id] = f"What is {st.session_state.final_jeopardy_answer}?"
-                    else:
-                        st.session_state.final_answers[player_id] = "What is [incorrect]?"
-                    
-                    st.info(f"{player_data['name']} has submitted their answer")
+        pending = [pid for pid in st.session_state.players
+                   if st.session_state.final_wagers[pid] > 0 and pid not in st.session_state.final_answers]
+        
+        # AI answers, simulated together
+        ai_ids = [pid for pid in pending if st.session_state.players[pid].get('is_ai')]
+        if ai_ids:
+            ai_correct = simulate_ai_responses(
+                st.session_state.final_jeopardy_category,
+                st.session_state.difficulty,
+                [st.session_state.players[pid].get('personality', 'Balanced') for pid in ai_ids]
+            )
+            
+            for player_id, is_correct in zip(ai_ids, ai_correct):
+                if is_correct:
+                    st.session_state.final_answers[player_id] = f"What is {st.session_state.final_jeopardy_answer}?"
                 else:
-                    answer = st.text_area(
-                        f"{player_data['name']}'s answer",
-                        placeholder="Remember to phrase as a question!",
-                        key=f"final_answer_{player_id}"
-                    )
-                    
-                    if st.button(f"Submit {player_data['name']}'s answer", key=f"submit_{player_id}"):
-                        st.session_state.final_answers[player_id] = answer
-                        st.rerun()
+                    st.session_state.final_answers[player_id] = "What is [incorrect]?"
+                
+                st.info(f"{st.session_state.players[player_id]['name']} has submitted their answer")
+        
+        for player_id in pending:
+            player_data = st.session_state.players[player_id]
+            if not player_data.get('is_ai'):
+                final_answer_input(player_id, player_data)
         
         return
     
     # Results phase
     st.markdown("### 🏆 Final Jeopardy Results")
     
-    answer_checker = JeopardyAnswerChecker()
-    final_scores = {}
-    
-    for player_id, player_data in st.session_state.players.items():
-        wager = st.session_state.final_wagers.get(player_id, 0)
-        answer = st.session_state.final_answers.get(player_id, "")
-        
-        if wager > 0:
-            is_correct, _ = answer_checker.check_answer(answer, st.session_state.final_jeopardy_answer)
-            
-            if is_correct:
-                st.success(f"✅ {player_data['name']}: Correct! +${wager:,}")
-                st.session_state.scores[player_id] += wager
-            else:
-                st.error(f"❌ {player_data['name']}: Incorrect! -${wager:,}")
-                st.session_state.scores[player_id] -= wager
-        
-        final_scores[player_id] = st.session_state.scores[player_id]
+    answer_checker = get_answer_checker()
+    player_ids = list(st.session_state.players.keys())
+    
+    # Score all wagers in one pass
+    wagers = np.array([st.session_state.final_wagers.get(pid, 0) for pid in player_ids], dtype=np.int64)
+    correct = np.array([
+        wager > 0 and answer_checker.check_answer(
+            st.session_state.final_answers.get(pid, ""),
+            st.session_state.final_jeopardy_answer
+        )[0]
+        for pid, wager in zip(player_ids, wagers)
+    ], dtype=bool)
+    deltas = np.where(correct, wagers, -wagers)
+    
+    # Reruns of the results screen must not apply the wagers again,
+    # and reuse the standings ranked when they were applied
+    if not st.session_state.final_results_recorded:
+        st.session_state.scores.add(player_ids, deltas)
+        st.session_state.final_standings = st.session_state.scores.ranking(player_ids)
+    final_scores = {pid: st.session_state.scores[pid] for pid in player_ids}
+    
+    results_df = pd.DataFrame({
+        'Player': [st.session_state.players[pid]['name'] for pid in player_ids],
+        'Result': np.where(wagers == 0, '➖ No wager', np.where(correct, '✅ Correct', '❌ Incorrect')),
+        'Wager': wagers,
+        'Change': deltas,
+        'Score': [final_scores[pid] for pid in player_ids],
+    })
+    st.dataframe(
+        results_df.style.format({'Wager': '${:,}', 'Change': '{:+,}', 'Score': '${:,}'}),
+        use_container_width=True,
+        hide_index=True
+    )
     
     st.info(f"The correct answer was: **{st.session_state.final_jeopardy_answer}**")
     
     # Display final standings
     st.markdown("### 🎯 Final Standings")
     
-    sorted_players = sorted(final_scores.items(), key=lambda x: x[1], reverse=True)
+    sorted_players = st.session_state.final_standings
     
-    for i, (player_id, score) in enumerate(sorted_players):
-        player_data = st.session_state.players[player_id]
-        
-        if i == 0:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #FFD700 0%, #FFA000 100%); 
-                        color: white; padding: 2rem; border-radius: 15px; margin: 1rem 0;">
-                <h2>🏆 WINNER: {player_data['name']}</h2>
-                <h1>${score:,}</h1>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div style="background: white; border: 2px solid #060CE9; 
-                        padding: 1rem; border-radius: 10px; margin: 0.5rem 0;">
-                <h3>#{i+1} {player_data['name']}: ${score:,}</h3>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Update stats
-    winner_id = sorted_players[0][0]
-    st.session_state.game_stats[st.session_state.players[winner_id]['name']]['games'] += 1
-    st.session_state.game_stats[st.session_state.players[winner_id]['name']]['wins'] += 1
+    standings_html = "".join(
+        (WINNER_TEMPLATE if i == 0 else RUNNER_UP_TEMPLATE).format(
+            place=i + 1, name=st.session_state.players[player_id]['name'], score=score
+        )
+        for i, (player_id, score) in enumerate(sorted_players)
+    )
+    st.markdown(f"<div>{standings_html}</div>", unsafe_allow_html=True)
+    
+    # Update stats once per game
+    if not st.session_state.final_results_recorded:
+        winner_name = st.session_state.players[sorted_players[0][0]]['name']
+        st.session_state.game_stats[winner_name]['games'] += 1
+        st.session_state.game_stats[winner_name]['wins'] += 1
+        st.session_state.final_results_recorded = True
     
     if st.button("🎮 New Game", use_container_width=True, type="primary"):
         reset_game()
@@ -1007,10 +1125,12 @@ def reset_game():
     """Reset game state for new game"""
     st.session_state.game_phase = "menu"
     st.session_state.board = None
-    st.session_state.scores = defaultdict(int)
+    st.session_state.scores = ScoreBoard()
     st.session_state.players = {}
     st.session_state.final_wagers = {}
     st.session_state.final_answers = {}
+    st.session_state.final_results_recorded = False
+    st.session_state.final_standings = []
     reset_question_state()
 
 # Tournament Mode
@@ -1058,56 +1178,95 @@ def setup_tournament():
 def create_tournament_bracket(players: List[str]) -> List[List[tuple]]:
     """Create tournament bracket pairings"""
     random.shuffle(players)
-    bracket = []
     
     # First round
-    first_round = []
-    for i in range(0, len(players), 2):
-        first_round.append((players[i], players[i+1]))
-    bracket.append(first_round)
-    
-    # Calculate subsequent rounds
-    num_rounds = len(players) // 2
-    while num_rounds > 1:
-        num_rounds = num_rounds // 2
-        bracket.append([None] * num_rounds)
-    
-    return bracket
+    first_round = [(players[i], players[i+1]) for i in range(0, len(players), 2)]
+    
+    # Subsequent rounds halve the number of matches until the final
+    num_players = len(players)
+    return [first_round] + [[None] * (num_players >> r) for r in range(2, num_players.bit_length())]
+
+# Question files in order of preference
+QUESTION_FILES = [
+    "data/all_jeopardy_clues.csv",
+    "data/questions_sample.json",
+    "data/jeopardy_questions_fixed.json",
+]
+
+# Parsed CSV cache shared by all workers and restarts
+QUESTIONS_CACHE_DIR = os.path.expanduser("~/.jaypardy/cache")
+# Bump whenever _read_questions_csv changes what it produces
+QUESTIONS_CACHE_VERSION = 2
+
+def _questions_cache_path(path: str) -> str:
+    """Get the disk cache file for a data file, keyed by its size, mtime and header"""
+    stat = os.stat(path)
+    digest = hashlib.sha1(f"{QUESTIONS_CACHE_VERSION}:{stat.st_size}:{stat.st_mtime}".encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(65536))
+    return os.path.join(QUESTIONS_CACHE_DIR, f"{digest.hexdigest()}.pkl")
+
+def _read_questions_csv(path: str) -> pd.DataFrame:
+    """Read and normalize a questions CSV, reusing the disk cache when possible"""
+    cache_path = _questions_cache_path(path)
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            pass
+    
+    df = pd.read_csv(path)
+    column_mapping = {
+        'clue': 'question',
+        'correct_response': 'answer',
+    }
+    df.rename(columns=column_mapping, inplace=True)
+    
+    # Low-cardinality text columns as categoricals: integer codes instead of
+    # one Python string per row, and integer compares when filtering
+    if 'category' in df.columns:
+        df['category'] = pd.Categorical(df['category'].str.upper())
+    if 'round' in df.columns:
+        df['round'] = df['round'].astype('category')
+    
+    # Write to a temp file first so concurrent workers never read a partial pickle
+    try:
+        os.makedirs(QUESTIONS_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+        
+        # Drop pickles from older code or older versions of the data
+        for name in os.listdir(QUESTIONS_CACHE_DIR):
+            stale_path = os.path.join(QUESTIONS_CACHE_DIR, name)
+            if name.endswith('.pkl') and stale_path != cache_path:
+                os.remove(stale_path)
+    except OSError:
+        pass
+    
+    return df
 
 # Load questions
 @st.cache_data
 def load_questions(file_path: str = None) -> pd.DataFrame:
     """Load Jeopardy questions from file"""
     try:
-        paths_to_try = [
-            "data/all_jeopardy_clues.csv",
-            "data/questions_sample.json",
-            "data/jeopardy_questions_fixed.json",
-        ]
-        
-        for path in paths_to_try:
-            if os.path.exists(path):
-                try:
-                    if path.endswith('.json'):
-                        with open(path, 'r') as f:
-                            data = json.load(f)
-                            df = pd.DataFrame(data)
-                    elif path.endswith('.csv'):
-                        df = pd.read_csv(path)
-                        column_mapping = {
-                            'clue': 'question',
-                            'correct_response': 'answer',
-                        }
-                        df.rename(columns=column_mapping, inplace=True)
-                        if 'category' in df.columns:
-                            df['category'] = df['category'].str.upper()
-                    
-                    if not df.empty:
-                        required_cols = ['question', 'answer', 'category']
-                        if all(col in df.columns for col in required_cols):
-                            return df
-                except Exception as e:
-                    continue
+        # Existence is checked here, so only on a cache miss, not every rerun
+        for path in filter(os.path.exists, QUESTION_FILES):
+            try:
+                if path.endswith('.json'):
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                        df = pd.DataFrame(data)
+                else:
+                    df = _read_questions_csv(path)
+                
+                if not df.empty:
+                    required_cols = ['question', 'answer', 'category']
+                    if all(col in df.columns for col in required_cols):
+                        return df
+            except Exception as e:
+                continue
         
         # Fallback
         return pd.DataFrame([
@@ -1152,16 +1311,15 @@ def main():
                 value=st.session_state.difficulty
             )
             
-            if st.button("🚪 Logout"):
-                for key in st.session_state.keys():
-                    del st.session_state[key]
+            if not NO_AUTH and st.button("🚪 Logout"):
+                st.session_state.clear()
                 st.rerun()
     
     # Main content
     if not st.session_state.logged_in:
         # Login (reuse existing)
         st.session_state.logged_in = True
-        st.session_state.username = "Player"
+        st.session_state.username = "Guest" if NO_AUTH else "Player"
         st.rerun()
     
     # Load questions
@@ -1194,6 +1352,7 @@ def main():
         # Create board if needed
         if not st.session_state.board:
             st.session_state.board = JeopardyBoard.create_board(df)
+            st.session_state.remaining_cells = sum(len(values) for values in st.session_state.board.values())
         
         # Display board
         JeopardyBoard.display_board()
@@ -700,24 +700,22 @@ with col4:
             user_id = auth.get_user_id(st.session_state.user_email)
             session_file = Path(f"user_data/{user_id}_session.json")
             if session_file.exists():
-                with open(session_file, 'r') as f:
-                    saved_data = json.load(f)
-                    all_history = saved_data.get('history', [])
-                    if all_history:
-                        total_all = len(all_history)
-                        st.markdown("""
-                        <div class="stat-card">
-                            <div class="stat-label">Lifetime Questions</div>
-                            <div class="stat-value">{}</div>
-                        </div>
-                        """.format(total_all), unsafe_allow_html=True)
-                    else:
-                        st.markdown("""
-                        <div class="stat-card">
-                            <div class="stat-label">Lifetime Questions</div>
-                            <div class="stat-value">0</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                all_history = auth.get_saved_history(st.session_state.user_email)
+                if all_history:
+                    total_all = len(all_history)
+                    st.markdown("""
+                    <div class="stat-card">
+                        <div class="stat-label">Lifetime Questions</div>
+                        <div class="stat-value">{}</div>
+                    </div>
+                    """.format(total_all), unsafe_allow_html=True)
+                else:
+                    st.markdown("""
+                    <div class="stat-card">
+                        <div class="stat-label">Lifetime Questions</div>
+                        <div class="stat-value">0</div>
+                    </div>
+                    """, unsafe_allow_html=True)
         except:
             st.markdown("""
             <div class="stat-card">
@@ -1420,7 +1418,10 @@ if st.session_state.history:
                     saved_data = json.load(f)
                 
                 st.write("**Lifetime Statistics:**")
-                all_history = saved_data.get('history', [])
+                if AUTH_AVAILABLE and auth:
+                    all_history = auth.get_saved_history(st.session_state.user_email)
+                else:
+                    all_history = saved_data.get('history', [])
                 if all_history:
                     total_all_time = len(all_history)
                     correct_all_time = sum(1 for h in all_history if h.get('was_correct'))
@@ -8,6 +8,16 @@ from database import JeopardyDatabase
 auth_bp = Blueprint('auth', __name__)
 db = JeopardyDatabase()
 
+# Password hashing cost. Existing hashes keep verifying because
+# check_password_hash reads the method and iteration count from the hash.
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:120000')
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+
 def login_required(f):
     """Decorator to require login for routes."""
     @wraps(f)
@@ -20,18 +30,17 @@ def login_required(f):
 
 def validate_email(email):
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def validate_password(password):
     """Validate password strength."""
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
-    if not re.search(r'[A-Z]', password):
+    if not _UPPER_RE.search(password):
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r'[a-z]', password):
+    if not _LOWER_RE.search(password):
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "Password must contain at least one number"
     return True, "Password is valid"
 
@@ -61,10 +70,11 @@ def register():
             errors.append(password_msg)
         
         # Check if username or email already exists
-        if db.get_user_by_username(username):
+        conflicts = db.get_user_conflicts(username, email)
+        if 'username' in conflicts:
             errors.append("Username already exists")
         
-        if db.get_user_by_email(email):
+        if 'email' in conflicts:
             errors.append("Email already registered")
         
         if errors:
@@ -75,7 +85,7 @@ def register():
                                  email=email)
         
         # Create user
-        password_hash = generate_password_hash(password)
+        password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         user_id = db.create_user(username, email, password_hash)
         
         if user_id:
@@ -182,7 +192,7 @@ def change_password():
         return redirect(url_for('auth.profile'))
     
     # Update password
-    new_password_hash = generate_password_hash(new_password)
+    new_password_hash = generate_password_hash(new_password, method=PASSWORD_HASH_METHOD)
     with db.get_connection() as conn:
         conn.execute(
             'UPDATE users SET password_hash = ? WHERE id = ?',
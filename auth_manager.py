@@ -5,20 +5,380 @@ import streamlit as st
 import json
 import os
 import datetime
-import time
 import hashlib
-import pickle
+import functools
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# For Google OAuth
+# Fast JSON encoder/decoder for session files, with stdlib fallback
 try:
-    from streamlit_oauth import OAuth2Component
-    OAUTH_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    OAUTH_AVAILABLE = False
-    st.warning("OAuth not installed. Run: pip install streamlit-oauth")
+    ORJSON_AVAILABLE = False
+
+# Session files are only read by the app; set JAYOPARDY_PRETTY_JSON=1 to
+# indent them when debugging
+PRETTY_SESSION_JSON = bool(os.environ.get('JAYOPARDY_PRETTY_JSON'))
+
+def json_default(obj):
+    """Encode datetimes for the stdlib fallback the way orjson does"""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_session_json(data):
+    """Serialize session data to JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if PRETTY_SESSION_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if PRETTY_SESSION_JSON:
+        return json.dumps(data, indent=2, default=json_default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=json_default).encode('utf-8')
+
+def load_session_json(raw):
+    """Parse session JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json_line(data):
+    """Serialize one record as a single JSON line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def write_file_atomic(path, payload):
+    """Write bytes to path via a temp file and os.replace"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+def write_session_file(path, payload, append=False):
+    """Background write job; reports failures since no caller is waiting"""
+    try:
+        if append:
+            with open(path, 'ab') as f:
+                f.write(payload)
+        else:
+            write_file_atomic(path, payload)
+    except OSError as e:
+        print(f"Error saving session {path}: {e}")
+
+# Newest queued payload per session file. A save that lands while an older
+# write for the same file is still queued replaces it instead of adding a
+# second write.
+_pending_session_payloads = {}
+_pending_session_lock = threading.Lock()
+
+def write_latest_session_file(path):
+    """Background job that writes the newest queued payload for path"""
+    with _pending_session_lock:
+        payload = _pending_session_payloads.pop(path, None)
+    if payload is not None:
+        write_session_file(path, payload)
+
+def queue_session_write(writer, path, payload):
+    """Queue a full rewrite of path, coalescing with any pending one"""
+    with _pending_session_lock:
+        already_queued = path in _pending_session_payloads
+        _pending_session_payloads[path] = payload
+    if not already_queued:
+        writer.submit(write_latest_session_file, path)
+
+@st.cache_resource
+def get_session_writer():
+    """Single background thread that performs session file writes in order"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix='auth-io')
+
+GOOGLE_JWKS_URI = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+@st.cache_resource
+def get_google_jwk_client():
+    """Shared JWKS client so Google's signing keys are fetched once per process"""
+    from jwt import PyJWKClient
+    return PyJWKClient(GOOGLE_JWKS_URI, cache_keys=True)
+
+# Google id_tokens are valid for an hour; the OAuth component can hand the
+# same token back on several reruns
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
+def verify_google_id_token(id_token, client_id):
+    """Verify a Google id_token's signature and claims, cached per token"""
+    import jwt
+    signing_key = get_google_jwk_client().get_signing_key_from_jwt(id_token)
+    claims = jwt.decode(id_token, signing_key.key, algorithms=["RS256"], audience=client_id,
+                        options={"require": ["exp", "iss"]})
+    # Google issues tokens under either form of its issuer
+    if claims["iss"] not in GOOGLE_ISSUERS:
+        raise jwt.InvalidIssuerError("Invalid issuer")
+    return claims
+
+def decode_google_id_token(id_token, client_id):
+    """Verify a Google id_token and return its claims
+    
+    Cached claims are checked against the clock on every call, so a token
+    stops working when it expires rather than when its cache entry does.
+    """
+    import jwt
+    claims = verify_google_id_token(id_token, client_id)
+    if claims["exp"] <= datetime.datetime.now(datetime.timezone.utc).timestamp():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return claims
+
+# Bounds on the parsed-file caches so long-running servers don't keep every
+# user's history in memory
+SESSION_CACHE_TTL = 300
+SESSION_CACHE_ENTRIES = 512
+
+@st.cache_data(show_spinner=False, ttl=SESSION_CACHE_TTL, max_entries=SESSION_CACHE_ENTRIES)
+def read_session_file(path, mtime):
+    """Read and parse a session file; cached until its mtime changes"""
+    with open(path, 'rb') as f:
+        return load_session_json(f.read())
+
+@st.cache_data(show_spinner=False, ttl=SESSION_CACHE_TTL, max_entries=SESSION_CACHE_ENTRIES)
+def read_history_log(path, mtime):
+    """Read a JSON-lines history log; cached until its mtime changes"""
+    with open(path, 'rb') as f:
+        return [load_session_json(line) for line in f if line.strip()]
+
+# Progress fields stored in the session file, as (key, default). Mutable
+# defaults are factories so sessions never share the same object.
+SESSION_FIELDS = (
+    ('score', 0),
+    ('total', 0),
+    ('weak_categories', dict),
+    ('strong_categories', dict),
+)
+# Settings defaults are all immutable, so they can be merged directly
+SETTINGS_DEFAULTS = {
+    'use_timer': False,
+    'timer_seconds': 5,
+    'adaptive_mode': False,
+}
+
+def field_default(default):
+    return default() if callable(default) else default
+
+# Partial reruns for the login tabs where this Streamlit version supports them
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Custom CSS for the login page, built once at import
+LOGIN_PAGE_CSS = """
+<style>
+/* Main container styling */
+.stApp > .main {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+
+/* Fix text visibility */
+.stMarkdown p, .stText {
+    color: #333;
+}
+
+/* Alert boxes text fix */
+.stAlert {
+    background-color: rgba(255, 255, 255, 0.95) !important;
+}
+
+.stAlert > div {
+    color: #333 !important;
+}
+
+/* Login container */
+.login-container {
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(10px);
+    border-radius: 20px;
+    padding: 2rem;
+    box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
+    animation: slideUp 0.5s ease-out;
+}
+
+@keyframes slideUp {
+    from {
+        opacity: 0;
+        transform: translateY(30px);
+    }
+    to {
+        opacity: 1;
+        transform: translateY(0);
+    }
+}
+
+/* Logo styling */
+.logo-container {
+    text-align: center;
+    margin-bottom: 2rem;
+}
+
+.logo {
+    width: 80px;
+    height: 80px;
+    background: linear-gradient(135deg, #667eea, #764ba2);
+    border-radius: 20px;
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    font-size: 36px;
+    color: white;
+    margin: 0 auto 15px;
+    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
+    font-weight: bold;
+}
+
+/* Button styling */
+.stButton > button {
+    background: linear-gradient(135deg, #667eea, #764ba2);
+    color: white;
+    border: none;
+    border-radius: 10px;
+    padding: 0.75rem 1.5rem;
+    font-weight: 600;
+    transition: all 0.3s ease;
+    width: 100%;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
+}
+
+/* Tab styling */
+.stTabs [data-baseweb="tab-list"] {
+    gap: 0.5rem;
+    background-color: rgba(255, 255, 255, 0.95);
+    border-radius: 10px;
+    padding: 0.5rem;
+}
+
+.stTabs [data-baseweb="tab"] {
+    border-radius: 8px;
+    color: #555 !important;
+    font-weight: 500;
+}
+
+.stTabs [aria-selected="true"] {
+    background-color: white;
+    color: #667eea !important;
+}
+
+/* Tab panel background - dark for contrast */
+.stTabs [data-baseweb="tab-panel"] {
+    background: rgba(0, 0, 0, 0.5);
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-top: 1rem;
+    border: 1px solid rgba(255, 255, 255, 0.2);
+}
+
+/* Form inputs on login page */
+.stTabs [data-baseweb="tab-panel"] .stTextInput > div > div > input {
+    background: rgba(255, 255, 255, 0.1) !important;
+    border: 2px solid rgba(255, 255, 255, 0.3) !important;
+    color: white !important;
+}
+
+.stTabs [data-baseweb="tab-panel"] .stTextInput > div > div > input:focus {
+    border-color: #667eea !important;
+    background: rgba(255, 255, 255, 0.15) !important;
+}
+
+/* Input styling */
+.stTextInput > div > div > input {
+    border-radius: 10px;
+    border: 2px solid #e0e0e0;
+    padding: 0.75rem 1rem;
+    transition: all 0.3s ease;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: #667eea;
+    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+}
+
+/* Social button styling */
+.social-btn {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 0.5rem;
+    padding: 0.75rem;
+    border: 2px solid #e0e0e0;
+    background: white;
+    border-radius: 10px;
+    color: #555;
+    font-weight: 500;
+    transition: all 0.3s ease;
+    width: 100%;
+    margin-bottom: 0.5rem;
+}
+
+.social-btn:hover {
+    border-color: #667eea;
+    background: #f8f8ff;
+    cursor: pointer;
+}
+
+/* Guest play card */
+.guest-card {
+    background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 15px;
+    margin-bottom: 1rem;
+    box-shadow: 0 10px 25px rgba(0, 0, 0, 0.2);
+}
+
+.benefits-row {
+    display: flex;
+    gap: 1rem;
+}
+
+.benefit-card {
+    flex: 1;
+    background: white;
+    padding: 1rem;
+    border-radius: 10px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    text-align: center;
+    margin-bottom: 1rem;
+}
+</style>
+"""
+
+# "Why Create an Account?" section, one element instead of a heading plus
+# three columns
+BENEFITS_HTML = """
+<br><br>
+<h3 style='color: white; text-align: center;'>🌟 Why Create an Account?</h3>
+<div class="benefits-row">
+<div class="benefit-card">
+    <h3 style='color: #333;'>💾 Save Progress</h3>
+    <p style='color: #666;'>Your scores and history are saved automatically</p>
+</div>
+<div class="benefit-card">
+    <h3 style='color: #333;'>📊 Track Stats</h3>
+    <p style='color: #666;'>See your improvement over time with detailed analytics</p>
+</div>
+<div class="benefit-card">
+    <h3 style='color: #333;'>🎯 Smart Training</h3>
+    <p style='color: #666;'>Adaptive mode learns and focuses on your weak areas</p>
+</div>
+</div>
+"""
 
 class AuthManager:
+    # Game state and save bookkeeping dropped from the session on logout
+    _CLEAR_ON_LOGOUT = ('history', 'score', 'total', 'current_clue',
+                        'weak_categories', 'strong_categories', 'is_guest',
+                        '_saved_history_len', '_saved_fingerprint')
+    
     def __init__(self):
         self.users_dir = Path("user_data")
         self.users_dir.mkdir(exist_ok=True)
@@ -31,71 +391,160 @@ class AuthManager:
         if 'user_name' not in st.session_state:
             st.session_state.user_name = None
     
-    def get_user_id(self, email):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_user_id(email):
         """Generate a unique user ID from email"""
-        return hashlib.md5(email.encode()).hexdigest()
+        return hashlib.blake2b(email.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_user_files(users_dir, email):
+        """Return the (session file, history log) paths for a user"""
+        user_id = AuthManager.get_user_id(email)
+        return users_dir / f"{user_id}_session.json", users_dir / f"{user_id}_history.jsonl"
+    
+    def migrate_legacy_session(self, email, session_file):
+        """Rename a session file saved under the old MD5-based user ID"""
+        legacy_id = hashlib.md5(email.encode()).hexdigest()
+        legacy_file = self.users_dir / f"{legacy_id}_session.json"
+        if legacy_file.exists():
+            os.replace(legacy_file, session_file)
+    
+    def get_saved_history(self, email):
+        """Return a user's answer history as saved on disk"""
+        session_file, history_file = self.get_user_files(self.users_dir, email)
+        if history_file.exists():
+            return read_history_log(str(history_file), history_file.stat().st_mtime)
+        # Sessions saved before the history log existed keep history inline
+        if session_file.exists():
+            session_data = read_session_file(str(session_file), session_file.stat().st_mtime)
+            return session_data.get('history', [])
+        return []
+    
+    def get_progress_data(self, state):
+        """Collect the progress fields stored in the session file
+        
+        state is a plain dict snapshot of st.session_state. History is
+        kept separately in an append-only log.
+        """
+        progress_data = {key: state.get(key, field_default(default))
+                         for key, default in SESSION_FIELDS}
+        progress_data['settings'] = {key: state.get(key, default)
+                                     for key, default in SETTINGS_DEFAULTS.items()}
+        return progress_data
+    
+    def get_progress_fingerprint(self, state, progress_data):
+        """Cheap fingerprint used to detect unsaved changes"""
+        return hash((state.get('user_email'),
+                     len(state.get('history', [])),
+                     dump_session_json(progress_data)))
+    
+    def has_unsaved_changes(self):
+        """True if a signed-in user's progress differs from the last save/load"""
+        state = st.session_state.to_dict()
+        if not state.get('authenticated') or state.get('is_guest', False):
+            return False
+        fingerprint = self.get_progress_fingerprint(state, self.get_progress_data(state))
+        return state.get('_saved_fingerprint') != fingerprint
     
     def save_user_session(self):
-        """Save current session data for the user"""
-        if not st.session_state.authenticated:
-            return
+        """Save current session data for the user
+        
+        Returns True if the file was written, False if there was nothing
+        to save (guest, logged out, or no changes since the last save/load).
+        Bursts of saves (Save Progress, New Session, logout) collapse to one
+        write because only the first finds unsaved changes.
+        """
+        # Read session state once into a plain dict
+        state = st.session_state.to_dict()
+        if not state.get('authenticated'):
+            return False
         
         # Don't save for guest users
-        if st.session_state.get('is_guest', False):
-            return
+        if state.get('is_guest', False):
+            return False
+        
+        # Skip the write when nothing changed since the last save or load
+        progress_data = self.get_progress_data(state)
+        fingerprint = self.get_progress_fingerprint(state, progress_data)
+        if state.get('_saved_fingerprint') == fingerprint:
+            return False
         
-        user_id = self.get_user_id(st.session_state.user_email)
-        session_file = self.users_dir / f"{user_id}_session.json"
+        session_file, history_file = self.get_user_files(self.users_dir, state['user_email'])
+        writer = get_session_writer()
+        
+        # Append only the history entries added since the last save
+        history = state.get('history', [])
+        saved_len = state.get('_saved_history_len', 0)
+        if len(history) < saved_len:
+            # History was reset, so rewrite the whole log
+            writer.submit(write_session_file, history_file,
+                          b''.join(dump_json_line(entry) for entry in history))
+        elif len(history) > saved_len:
+            writer.submit(write_session_file, history_file,
+                          b''.join(dump_json_line(entry) for entry in history[saved_len:]), True)
         
         # Prepare session data
         session_data = {
-            'email': st.session_state.user_email,
-            'name': st.session_state.user_name,
-            'last_login': datetime.datetime.now().isoformat(),
-            'history': st.session_state.get('history', []),
-            'score': st.session_state.get('score', 0),
-            'total': st.session_state.get('total', 0),
-            'weak_categories': st.session_state.get('weak_categories', {}),
-            'strong_categories': st.session_state.get('strong_categories', {}),
-            'settings': {
-                'use_timer': st.session_state.get('use_timer', False),
-                'timer_seconds': st.session_state.get('timer_seconds', 5),
-                'adaptive_mode': st.session_state.get('adaptive_mode', False)
-            }
+            'email': state['user_email'],
+            'name': state.get('user_name'),
+            'last_login': datetime.datetime.now(),
+            **progress_data
         }
         
-        # Save to file
-        with open(session_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
+        # Save to file in the background: one write to a sibling temp file,
+        # then an atomic rename so a crash mid-write never leaves a
+        # truncated session. The payload is built here so the writer
+        # never touches session state.
+        queue_session_write(writer, session_file, dump_session_json(session_data))
+        st.session_state.update({
+            '_saved_history_len': len(history),
+            '_saved_fingerprint': fingerprint,
+        })
+        return True
     
     def load_user_session(self):
         """Load saved session data for the user"""
         if not st.session_state.authenticated:
             return False
         
-        user_id = self.get_user_id(st.session_state.user_email)
-        session_file = self.users_dir / f"{user_id}_session.json"
+        # Nothing from a previous user's session has been saved for this one
+        st.session_state._saved_history_len = 0
+        st.session_state.pop('_saved_fingerprint', None)
+        
+        session_file, history_file = self.get_user_files(self.users_dir, st.session_state.user_email)
         
         if not session_file.exists():
-            return False
+            self.migrate_legacy_session(st.session_state.user_email, session_file)
+            if not session_file.exists():
+                return False
         
         try:
-            with open(session_file, 'r') as f:
-                session_data = json.load(f)
+            session_data = read_session_file(str(session_file), session_file.stat().st_mtime)
             
-            # Restore session state
-            st.session_state.history = session_data.get('history', [])
-            st.session_state.score = session_data.get('score', 0)
-            st.session_state.total = session_data.get('total', 0)
-            st.session_state.weak_categories = session_data.get('weak_categories', {})
-            st.session_state.strong_categories = session_data.get('strong_categories', {})
+            # Build the restored state locally, then apply it in one update.
+            # Sessions saved before the history log existed keep history
+            # inline; the next save moves it to the log.
+            pending = {}
+            if history_file.exists():
+                pending['history'] = read_history_log(str(history_file), history_file.stat().st_mtime)
+                pending['_saved_history_len'] = len(pending['history'])
+            else:
+                pending['history'] = session_data.get('history', [])
+            for key, default in SESSION_FIELDS:
+                pending[key] = session_data.get(key, field_default(default))
             
-            # Restore settings
+            # Restore settings: defaults overlaid with the known saved keys
             settings = session_data.get('settings', {})
-            st.session_state.use_timer = settings.get('use_timer', False)
-            st.session_state.timer_seconds = settings.get('timer_seconds', 5)
-            st.session_state.adaptive_mode = settings.get('adaptive_mode', False)
+            pending.update(SETTINGS_DEFAULTS)
+            pending.update({key: settings[key] for key in SETTINGS_DEFAULTS.keys() & settings.keys()})
             
+            # Freshly loaded state matches the file on disk
+            pending['_saved_fingerprint'] = self.get_progress_fingerprint(
+                dict(pending, user_email=st.session_state.user_email),
+                self.get_progress_data(pending))
+            st.session_state.update(pending)
             return True
         except Exception as e:
             st.error(f"Error loading session: {e}")
@@ -143,8 +592,12 @@ class AuthManager:
     
     def google_oauth_login(self):
         """Google OAuth login"""
-        if not OAUTH_AVAILABLE:
+        # Imported here so guest and email users never pay for the OAuth stack
+        try:
+            from streamlit_oauth import OAuth2Component
+        except ImportError:
             st.error("OAuth component not installed. Contact app administrator.")
+            st.info("Install it with: pip install streamlit-oauth")
             return
         
         # Google OAuth configuration - check if secrets exist
@@ -205,7 +658,11 @@ REDIRECT_URI = "https://jayopardy.streamlit.app" """)
             token = result.get("token")
             if token:
                 import jwt
-                user_info = jwt.decode(token["id_token"], options={"verify_signature": False})
+                try:
+                    user_info = decode_google_id_token(token["id_token"], CLIENT_ID)
+                except jwt.PyJWTError as e:
+                    st.error(f"Could not verify Google sign-in: {str(e)}")
+                    return
                 
                 st.session_state.authenticated = True
                 st.session_state.user_email = user_info.get("email")
@@ -219,186 +676,96 @@ REDIRECT_URI = "https://jayopardy.streamlit.app" """)
                 
                 st.rerun()
     
-    def show_login_page(self):
-        """Display the login page"""
-        # Custom CSS for beautiful login page
-        st.markdown("""
-        <style>
-        /* Main container styling */
-        .stApp > .main {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-        
-        /* Fix text visibility */
-        .stMarkdown p, .stText {
-            color: #333;
-        }
-        
-        /* Alert boxes text fix */
-        .stAlert {
-            background-color: rgba(255, 255, 255, 0.95) !important;
-        }
-        
-        .stAlert > div {
-            color: #333 !important;
-        }
-        
-        /* Login container */
-        .login-container {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            border-radius: 20px;
-            padding: 2rem;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-            animation: slideUp 0.5s ease-out;
-        }
-        
-        @keyframes slideUp {
-            from {
-                opacity: 0;
-                transform: translateY(30px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        /* Logo styling */
-        .logo-container {
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        
-        .logo {
-            width: 80px;
-            height: 80px;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-radius: 20px;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 36px;
-            color: white;
-            margin: 0 auto 15px;
-            box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
-            font-weight: bold;
-        }
-        
-        /* Button styling */
-        .stButton > button {
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            color: white;
-            border: none;
-            border-radius: 10px;
-            padding: 0.75rem 1.5rem;
-            font-weight: 600;
-            transition: all 0.3s ease;
-            width: 100%;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
-        }
-        
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 0.5rem;
-            background-color: rgba(255, 255, 255, 0.95);
-            border-radius: 10px;
-            padding: 0.5rem;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            border-radius: 8px;
-            color: #555 !important;
-            font-weight: 500;
-        }
-        
-        .stTabs [aria-selected="true"] {
-            background-color: white;
-            color: #667eea !important;
-        }
-        
-        /* Tab panel background - dark for contrast */
-        .stTabs [data-baseweb="tab-panel"] {
-            background: rgba(0, 0, 0, 0.5);
-            border-radius: 10px;
-            padding: 1.5rem;
-            margin-top: 1rem;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-        
-        /* Form inputs on login page */
-        .stTabs [data-baseweb="tab-panel"] .stTextInput > div > div > input {
-            background: rgba(255, 255, 255, 0.1) !important;
-            border: 2px solid rgba(255, 255, 255, 0.3) !important;
-            color: white !important;
-        }
-        
-        .stTabs [data-baseweb="tab-panel"] .stTextInput > div > div > input:focus {
-            border-color: #667eea !important;
-            background: rgba(255, 255, 255, 0.15) !important;
-        }
-        
-        /* Input styling */
-        .stTextInput > div > div > input {
-            border-radius: 10px;
-            border: 2px solid #e0e0e0;
-            padding: 0.75rem 1rem;
-            transition: all 0.3s ease;
-        }
-        
-        .stTextInput > div > div > input:focus {
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-        
-        /* Social button styling */
-        .social-btn {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 0.5rem;
-            padding: 0.75rem;
-            border: 2px solid #e0e0e0;
-            background: white;
-            border-radius: 10px;
-            color: #555;
-            font-weight: 500;
-            transition: all 0.3s ease;
-            width: 100%;
-            margin-bottom: 0.5rem;
-        }
+    @_fragment
+    def show_login_tabs(self):
+        """Guest and email login tabs, rerun on their own as the user types"""
+        # Add container background for better readability
+        st.markdown('<div style="background: rgba(255,255,255,0.05); padding: 20px; border-radius: 20px;">', unsafe_allow_html=True)
+        # Tabs for login options
+        tab1, tab2 = st.tabs(["🎮 Guest Play", "📧 Email Login"])
+        
+        with tab1:
+            st.markdown("""
+            <div class="guest-card">
+                <h3 style='margin-top: 0;'>🎮 Quick Play - No Account Needed!</h3>
+                <p>Jump right into the game without signing up. Perfect for trying out Jayopardy!</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.success("""
+                **✅ Includes:**
+                - All 577,000+ questions
+                - Timer & adaptive mode
+                - Session statistics
+                - All game features
+                """)
+            with col_b:
+                st.warning("""
+                **⚠️ Note:**
+                - Progress not saved
+                - No lifetime stats
+                - Resets on exit
+                """)
+            
+            if st.button("🎮 Play as Guest", type="primary", use_container_width=True, key="guest_play"):
+                st.session_state.authenticated = True
+                st.session_state.is_guest = True
+                st.session_state.user_email = "guest@jayopardy.app"
+                st.session_state.user_name = "Guest Player"
+                self.set_login_flash("🎉 Starting game... Have fun!", balloons=True)
+                st.rerun()
         
-        .social-btn:hover {
-            border-color: #667eea;
-            background: #f8f8ff;
-            cursor: pointer;
-        }
+        with tab2:
+            with st.form("email_login_form", clear_on_submit=False):
+                st.markdown("### 📧 Sign in with Email")
+                email = st.text_input("Email Address", placeholder="your@email.com", key="email_input")
+                password = st.text_input("Password", type="password", placeholder="Enter your password", key="password_input")
+                
+                col_a, col_b = st.columns(2)
+                with col_a:
+                    remember = st.checkbox("Remember me")
+                with col_b:
+                    st.markdown("<a href='#' style='float: right; color: #667eea;'>Forgot password?</a>", unsafe_allow_html=True)
+                
+                st.markdown("<br>", unsafe_allow_html=True)
+                
+                col_1, col_2 = st.columns(2)
+                with col_1:
+                    submit = st.form_submit_button("🔐 Sign In", use_container_width=True, type="primary")
+                with col_2:
+                    register = st.form_submit_button("✨ Sign Up", use_container_width=True)
+            
+            if submit and email:
+                st.session_state.authenticated = True
+                st.session_state.user_email = email
+                st.session_state.user_name = email.split('@')[0]
+                st.session_state.is_guest = False
+                
+                if self.load_user_session():
+                    self.set_login_flash(f"👋 Welcome back, {st.session_state.user_name}!")
+                else:
+                    self.set_login_flash(f"🎉 Welcome, {st.session_state.user_name}!")
+                st.rerun()
+            
+            elif register and email:
+                st.session_state.authenticated = True
+                st.session_state.user_email = email
+                st.session_state.user_name = email.split('@')[0]
+                st.session_state.is_guest = False
+                self.set_login_flash(f"🎊 Account created! Welcome, {st.session_state.user_name}!",
+                                     balloons=True)
+                st.rerun()
         
-        /* Guest play card */
-        .guest-card {
-            background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 15px;
-            margin-bottom: 1rem;
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.2);
-        }
         
-        .benefit-card {
-            background: white;
-            padding: 1rem;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            text-align: center;
-            margin-bottom: 1rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # Close container div
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    def show_login_page(self):
+        """Display the login page"""
+        # Custom CSS for beautiful login page
+        st.markdown(LOGIN_PAGE_CSS, unsafe_allow_html=True)
         
         # Logo and title
         col1, col2, col3 = st.columns([1, 2, 1])
@@ -415,119 +782,10 @@ REDIRECT_URI = "https://jayopardy.streamlit.app" """)
         col1, col2, col3 = st.columns([1, 3, 1])
         
         with col2:
-            # Add container background for better readability
-            st.markdown('<div style="background: rgba(255,255,255,0.05); padding: 20px; border-radius: 20px;">', unsafe_allow_html=True)
-            # Tabs for login options
-            tab1, tab2 = st.tabs(["🎮 Guest Play", "📧 Email Login"])
-            
-            with tab1:
-                st.markdown("""
-                <div class="guest-card">
-                    <h3 style='margin-top: 0;'>🎮 Quick Play - No Account Needed!</h3>
-                    <p>Jump right into the game without signing up. Perfect for trying out Jayopardy!</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.success("""
-                    **✅ Includes:**
-                    - All 577,000+ questions
-                    - Timer & adaptive mode
-                    - Session statistics
-                    - All game features
-                    """)
-                with col_b:
-                    st.warning("""
-                    **⚠️ Note:**
-                    - Progress not saved
-                    - No lifetime stats
-                    - Resets on exit
-                    """)
-                
-                if st.button("🎮 Play as Guest", type="primary", use_container_width=True, key="guest_play"):
-                    st.session_state.authenticated = True
-                    st.session_state.is_guest = True
-                    st.session_state.user_email = "guest@jayopardy.app"
-                    st.session_state.user_name = "Guest Player"
-                    st.balloons()
-                    st.success("🎉 Starting game... Have fun!")
-                    time.sleep(1)
-                    st.rerun()
-            
-            with tab2:
-                with st.form("email_login_form", clear_on_submit=False):
-                    st.markdown("### 📧 Sign in with Email")
-                    email = st.text_input("Email Address", placeholder="your@email.com", key="email_input")
-                    password = st.text_input("Password", type="password", placeholder="Enter your password", key="password_input")
-                    
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        remember = st.checkbox("Remember me")
-                    with col_b:
-                        st.markdown("<a href='#' style='float: right; color: #667eea;'>Forgot password?</a>", unsafe_allow_html=True)
-                    
-                    st.markdown("<br>", unsafe_allow_html=True)
-                    
-                    col_1, col_2 = st.columns(2)
-                    with col_1:
-                        submit = st.form_submit_button("🔐 Sign In", use_container_width=True, type="primary")
-                    with col_2:
-                        register = st.form_submit_button("✨ Sign Up", use_container_width=True)
-                
-                if submit and email:
-                    st.session_state.authenticated = True
-                    st.session_state.user_email = email
-                    st.session_state.user_name = email.split('@')[0]
-                    st.session_state.is_guest = False
-                    
-                    if self.load_user_session():
-                        st.success(f"👋 Welcome back, {st.session_state.user_name}!")
-                    else:
-                        st.success(f"🎉 Welcome, {st.session_state.user_name}!")
-                    time.sleep(1)
-                    st.rerun()
-                
-                elif register and email:
-                    st.session_state.authenticated = True
-                    st.session_state.user_email = email
-                    st.session_state.user_name = email.split('@')[0]
-                    st.session_state.is_guest = False
-                    st.balloons()
-                    st.success(f"🎊 Account created! Welcome, {st.session_state.user_name}!")
-                    time.sleep(1)
-                    st.rerun()
-            
-            
-            # Close container div
-            st.markdown('</div>', unsafe_allow_html=True)
+            self.show_login_tabs()
         
         # Benefits section
-        st.markdown("<br><br>", unsafe_allow_html=True)
-        st.markdown("<h3 style='color: white; text-align: center;'>🌟 Why Create an Account?</h3>", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown("""
-            <div class="benefit-card">
-                <h3 style='color: #333;'>💾 Save Progress</h3>
-                <p style='color: #666;'>Your scores and history are saved automatically</p>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            st.markdown("""
-            <div class="benefit-card">
-                <h3 style='color: #333;'>📊 Track Stats</h3>
-                <p style='color: #666;'>See your improvement over time with detailed analytics</p>
-            </div>
-            """, unsafe_allow_html=True)
-        with col3:
-            st.markdown("""
-            <div class="benefit-card">
-                <h3 style='color: #333;'>🎯 Smart Training</h3>
-                <p style='color: #666;'>Adaptive mode learns and focuses on your weak areas</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(BENEFITS_HTML, unsafe_allow_html=True)
     
     def logout(self):
         """Logout the current user"""
@@ -540,14 +798,27 @@ REDIRECT_URI = "https://jayopardy.streamlit.app" """)
         st.session_state.user_name = None
         
         # Clear game state
-        for key in ['history', 'score', 'total', 'current_clue', 'weak_categories', 'strong_categories']:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in self._CLEAR_ON_LOGOUT:
+            st.session_state.pop(key, None)
         
         st.rerun()
     
+    def set_login_flash(self, message, balloons=False):
+        """Queue a welcome message to show on the first run after login"""
+        st.session_state._login_flash = (message, balloons)
+    
+    def show_login_flash(self):
+        """Show and clear the welcome message queued by set_login_flash"""
+        flash = st.session_state.pop('_login_flash', None)
+        if flash:
+            message, balloons = flash
+            if balloons:
+                st.balloons()
+            st.success(message)
+    
     def show_user_menu(self):
         """Show user menu in sidebar"""
+        self.show_login_flash()
         with st.sidebar:
             st.markdown("---")
             
@@ -587,8 +858,9 @@ REDIRECT_URI = "https://jayopardy.streamlit.app" """)
                 col1, col2 = st.columns(2)
                 with col1:
                     if st.button("🔄 New Session", use_container_width=True):
-                        # Save current progress first
-                        self.save_user_session()
+                        # Save current progress first, if there is any
+                        if self.has_unsaved_changes():
+                            self.save_user_session()
                         # Reset current session but keep history
                         st.session_state.score = 0
                         st.session_state.total = 0
@@ -1,9 +1,32 @@
 import pandas as pd
+import numpy as np
 import re
 from collections import defaultdict
+from itertools import chain
 from typing import Dict, List, Set, Tuple
 import streamlit as st
 
+# Optional Aho-Corasick matcher for keyword lookups
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Common words used to place categories no theme matched, checked in order.
+# Words match anywhere in the category, like theme keywords.
+FALLBACK_RULES = (
+    ("HISTORY", ('century', 'year', 'war', 'empire', 'king', 'queen', 'president')),
+    ("ENTERTAINMENT", ('movie', 'film', 'tv', 'show', 'actor', 'star')),
+    ("LITERATURE", ('book', 'author', 'novel', 'poet', 'writer', 'literature')),
+    ("MUSIC", ('song', 'music', 'band', 'singer', 'album')),
+    ("SPORTS", ('sport', 'game', 'team', 'player', 'league', 'ball')),
+    ("SCIENCE", ('science', 'element', 'body', 'medical', 'doctor')),
+    ("WORDPLAY", ('word', 'letter', 'spell', 'rhyme', 'alphabet')),
+    ("GEOGRAPHY", ('geography', 'country', 'city', 'state', 'capital', 'world')),
+    ("FOOD & DRINK", ('food', 'eat', 'drink', 'cook', 'chef', 'recipe')),
+)
+
 class JeopardyCategoryAnalyzer:
     """Analyze and categorize Jeopardy categories into themes"""
     
@@ -38,7 +61,7 @@ class JeopardyCategoryAnalyzer:
             "LITERATURE": {
                 "keywords": ["literature", "books", "novels", "authors", "writers", "poets",
                             "poetry", "poems", "shakespeare", "classics", "fiction", 
-                            "characters", "novels", "stories", "tales", "fables", "plays",
+                            "characters", "stories", "tales", "fables", "plays",
                             "playwright", "literary", "reading", "bibliography"],
                 "patterns": [r"shakespeare", r"authors?", r"literat", r"book"]
             },
@@ -161,138 +184,218 @@ class JeopardyCategoryAnalyzer:
                 "patterns": [r"before.*after", r"before & after"]
             }
         }
+        
+        # Keywords that can't change whether their theme matches are left
+        # out of matching: any keyword containing another of the theme's
+        # keywords or plain-text patterns (e.g. "civil war" contains "war")
+        self.theme_keywords = {}
+        for theme, criteria in self.theme_patterns.items():
+            keywords = list(dict.fromkeys(criteria["keywords"]))
+            literals = keywords + [p for p in criteria["patterns"] if re.fullmatch(r"[\w ]+", p)]
+            self.theme_keywords[theme] = [
+                keyword for keyword in keywords
+                if not any(term != keyword and term in keyword for term in literals)
+            ]
+        
+        # With pyahocorasick, every keyword of every theme is found in one
+        # pass over the category; the regexes then only hold the patterns
+        self.keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            keyword_themes = defaultdict(list)
+            for theme, keywords in self.theme_keywords.items():
+                for keyword in keywords:
+                    keyword_themes[keyword].append(theme)
+            self.keyword_automaton = ahocorasick.Automaton()
+            for keyword, themes in keyword_themes.items():
+                self.keyword_automaton.add_word(keyword, tuple(themes))
+            self.keyword_automaton.make_automaton()
+        
+        # Fuse each theme's keywords and patterns into one regex, so a theme
+        # is matched with a single search
+        self.theme_match_patterns = {
+            theme: "|".join([re.escape(keyword) for keyword in self.theme_keywords[theme]] +
+                            [f"(?:{pattern})" for pattern in criteria["patterns"]])
+            for theme, criteria in self.theme_patterns.items()
+        }
+        self.theme_regexes = [
+            (theme, re.compile(
+                "|".join(f"(?:{pattern})" for pattern in self.theme_patterns[theme]["patterns"])
+                if self.keyword_automaton is not None else pattern))
+            for theme, pattern in self.theme_match_patterns.items()
+        ]
+        
+        # Each fallback rule's words fused into one regex
+        self.fallback_regexes = [
+            (theme, re.compile("|".join(map(re.escape, words))))
+            for theme, words in FALLBACK_RULES
+        ]
+        
+        # Every keyword, pattern and fallback word needs a letter or digit,
+        # so categories without one can skip matching
+        self.alnum_re = re.compile(r"[^\W_]")
+        
+        # Themes already worked out by categorize_single, keyed by category
+        self._themes_cache: Dict[str, Tuple[str, ...]] = {}
     
     def categorize_single(self, category: str) -> List[str]:
         """Categorize a single category string into themes"""
         if not category:
             return ["MISCELLANEOUS"]
+        
+        cached = self._themes_cache.get(category)
+        if cached is not None:
+            return list(cached)
             
         category_lower = str(category).lower()
-        matched_themes = []
+        if not self.alnum_re.search(category_lower):
+            return ["MISCELLANEOUS"]
         
-        # More aggressive matching - check for word boundaries
-        for theme, criteria in self.theme_patterns.items():
-            # Check keywords with word boundary matching
-            for keyword in criteria["keywords"]:
-                # Check for whole word match or as part of compound
-                if keyword in category_lower.split() or keyword in category_lower:
-                    matched_themes.append(theme)
-                    break
-            
-            # Check patterns
-            if theme not in matched_themes:
-                for pattern in criteria["patterns"]:
-                    if re.search(pattern, category_lower):
-                        matched_themes.append(theme)
-                        break
+        # A theme matches if any of its keywords appears in the category
+        # (whole word or as part of a compound) or any pattern matches
+        if self.keyword_automaton is not None:
+            keyword_hits = {theme for _, themes in self.keyword_automaton.iter(category_lower)
+                            for theme in themes}
+            matched_themes = [theme for theme, regex in self.theme_regexes
+                              if theme in keyword_hits or regex.search(category_lower)]
+        else:
+            matched_themes = [theme for theme, regex in self.theme_regexes
+                              if regex.search(category_lower)]
         
         # If no themes matched, try to be smarter about it
         if not matched_themes:
             # Check for common Jeopardy category patterns
-            if any(word in category_lower for word in ['century', 'year', 'war', 'empire', 'king', 'queen', 'president']):
-                matched_themes.append("HISTORY")
-            elif any(word in category_lower for word in ['movie', 'film', 'tv', 'show', 'actor', 'star']):
-                matched_themes.append("ENTERTAINMENT")
-            elif any(word in category_lower for word in ['book', 'author', 'novel', 'poet', 'writer', 'literature']):
-                matched_themes.append("LITERATURE")
-            elif any(word in category_lower for word in ['song', 'music', 'band', 'singer', 'album']):
-                matched_themes.append("MUSIC")
-            elif any(word in category_lower for word in ['sport', 'game', 'team', 'player', 'league', 'ball']):
-                matched_themes.append("SPORTS")
-            elif any(word in category_lower for word in ['science', 'element', 'body', 'medical', 'doctor']):
-                matched_themes.append("SCIENCE")
-            elif any(word in category_lower for word in ['word', 'letter', 'spell', 'rhyme', 'alphabet']):
-                matched_themes.append("WORDPLAY")
-            elif any(word in category_lower for word in ['geography', 'country', 'city', 'state', 'capital', 'world']):
-                matched_themes.append("GEOGRAPHY")
-            elif any(word in category_lower for word in ['food', 'eat', 'drink', 'cook', 'chef', 'recipe']):
-                matched_themes.append("FOOD & DRINK")
+            for theme, regex in self.fallback_regexes:
+                if regex.search(category_lower):
+                    matched_themes.append(theme)
+                    break
             else:
                 matched_themes.append("MISCELLANEOUS")
         
+        self._themes_cache[category] = tuple(matched_themes)
         return matched_themes
     
-    def analyze_categories(self, categories: List[str]) -> Dict[str, List[str]]:
-        """Analyze all categories and group them by theme"""
-        theme_groups = defaultdict(list)
-        category_themes = {}
+    def theme_masks(self, categories: List[str]) -> Tuple[pd.Series, Dict[str, np.ndarray]]:
+        """Match all categories at once
+        
+        Returns the categories as a Series and, for each theme that matched
+        anything, a boolean mask over them. Themes are ordered by number of
+        categories, most first.
+        """
+        series = pd.Series(categories, dtype=object)
+        if series.empty:
+            return series, {}
+        lowers = series.astype(str).str.lower()
+        blank = ~series.astype(bool).to_numpy()
         
-        for category in categories:
-            themes = self.categorize_single(category)
-            category_themes[category] = themes
-            for theme in themes:
-                theme_groups[theme].append(category)
+        # One vectorized search per theme over the whole list
+        assigned = pd.DataFrame({
+            theme: lowers.str.contains(pattern, regex=True).to_numpy(dtype=bool) & ~blank
+            for theme, pattern in self.theme_match_patterns.items()
+        }, index=series.index)
+        
+        # Categories no theme matched get the first fallback rule that hits
+        unmatched = ~assigned.to_numpy().any(axis=1)
+        fallback = np.select(
+            [lowers.str.contains(regex.pattern, regex=True).to_numpy(dtype=bool) & ~blank
+             for _, regex in self.fallback_regexes],
+            [theme for theme, _ in FALLBACK_RULES],
+            default="MISCELLANEOUS"
+        )
+        for theme in assigned.columns:
+            assigned[theme] |= unmatched & (fallback == theme)
+        assigned["MISCELLANEOUS"] = unmatched & (fallback == "MISCELLANEOUS")
+        
+        # Keep themes in order of first appearance, as a per-category loop
+        # would have added them
+        hits = assigned.to_numpy()
+        first_hit = hits.argmax(axis=0)
+        order = sorted((i for i in range(hits.shape[1]) if hits[:, i].any()),
+                       key=lambda i: (first_hit[i], i))
         
         # Sort themes by number of categories
-        sorted_themes = dict(sorted(theme_groups.items(), 
-                                  key=lambda x: len(x[1]), 
-                                  reverse=True))
+        counts = hits.sum(axis=0)
+        order.sort(key=lambda i: counts[i], reverse=True)
         
-        return sorted_themes
+        return series, {assigned.columns[i]: hits[:, i] for i in order}
+    
+    def analyze_categories(self, categories: List[str]) -> Dict[str, List[str]]:
+        """Analyze all categories and group them by theme"""
+        series, masks = self.theme_masks(categories)
+        return {theme: series[mask].tolist() for theme, mask in masks.items()}
     
     def get_theme_statistics(self, categories: List[str]) -> pd.DataFrame:
         """Get statistics about theme distribution"""
         theme_groups = self.analyze_categories(categories)
         
-        stats = []
-        for theme, cats in theme_groups.items():
-            stats.append({
-                'Theme': theme,
-                'Count': len(cats),
-                'Percentage': (len(cats) / len(categories)) * 100,
-                'Example Categories': ', '.join(cats[:3])
-            })
+        counts = np.array([len(cats) for cats in theme_groups.values()], dtype=np.int64)
         
-        return pd.DataFrame(stats)
+        return pd.DataFrame({
+            'Theme': list(theme_groups.keys()),
+            'Count': counts,
+            'Percentage': counts * 100.0 / max(len(categories), 1),
+            'Example Categories': [', '.join(cats[:3]) for cats in theme_groups.values()]
+        })
     
     def suggest_filter_groups(self, categories: List[str], max_groups: int = 15) -> Dict[str, List[str]]:
         """Suggest optimal filter groups for UI"""
-        theme_groups = self.analyze_categories(categories)
+        series, masks = self.theme_masks(categories)
         
-        # Create optimized groups
-        filter_groups = {}
+        # Pick themes by their counts; category lists are only built for the
+        # themes that are kept
+        counts = {theme: int(mask.sum()) for theme, mask in masks.items()}
+        selected = []
         
-        # Sort themes by count (excluding MISCELLANEOUS for now)
-        sorted_themes = sorted(
-            [(k, v) for k, v in theme_groups.items() if k != "MISCELLANEOUS"],
-            key=lambda x: len(x[1]),
-            reverse=True
-        )
+        # Themes by count (excluding MISCELLANEOUS for now)
+        sorted_themes = [theme for theme in counts if theme != "MISCELLANEOUS"]
         
         # Keep top themes with significant categories (lower threshold for real data)
-        for theme, cats in sorted_themes[:max_groups]:
-            if len(cats) >= 10:  # Lower threshold to 10 categories
-                filter_groups[theme] = cats
+        for theme in sorted_themes[:max_groups]:
+            if counts[theme] >= 10:  # Lower threshold to 10 categories
+                selected.append(theme)
         
         # If we don't have enough themes, add some with fewer categories
-        if len(filter_groups) < 5:
-            for theme, cats in sorted_themes:
-                if theme not in filter_groups and len(cats) >= 5:
-                    filter_groups[theme] = cats
-                if len(filter_groups) >= 8:
+        if len(selected) < 5:
+            for theme in sorted_themes:
+                if theme not in selected and counts[theme] >= 5:
+                    selected.append(theme)
+                if len(selected) >= 8:
                     break
         
+        filter_groups = {theme: series[masks[theme]].tolist() for theme in selected}
+        
         # Add "ALL CATEGORIES" option at the end
         filter_groups["ALL CATEGORIES"] = categories
         
         # Add MISCELLANEOUS only if it's not too large (less than 60% of total)
-        if "MISCELLANEOUS" in theme_groups:
-            misc_cats = theme_groups["MISCELLANEOUS"]
-            if len(misc_cats) > 0 and len(misc_cats) < len(categories) * 0.6:
-                filter_groups["OTHER/MISC"] = misc_cats
+        misc_count = counts.get("MISCELLANEOUS", 0)
+        if misc_count > 0 and misc_count < len(categories) * 0.6:
+            filter_groups["OTHER/MISC"] = series[masks["MISCELLANEOUS"]].tolist()
         
         return filter_groups
 
 
+@st.cache_resource
+def get_category_analyzer() -> JeopardyCategoryAnalyzer:
+    """Shared analyzer, so its compiled patterns and theme cache persist"""
+    return JeopardyCategoryAnalyzer()
+
+
+@st.cache_data(show_spinner=False)
+def prepare_category_selector(category_column: pd.Series, max_groups: int = 15
+                              ) -> Tuple[List[str], Dict[str, List[str]], Dict[str, str]]:
+    """Sorted categories, filter groups and group previews, cached until the column changes"""
+    categories = sorted(category_column.unique())
+    theme_groups = get_category_analyzer().suggest_filter_groups(categories, max_groups)
+    theme_previews = {theme: ", ".join(cats[:10]) for theme, cats in theme_groups.items()}
+    return categories, theme_groups, theme_previews
+
+
 # Enhanced UI Component for Streamlit App
 def create_themed_category_selector(df: pd.DataFrame, sidebar=True):
     """Create a themed category selector for Streamlit UI"""
     
-    analyzer = JeopardyCategoryAnalyzer()
-    categories = sorted(df["category"].unique())
-    
-    # Analyze categories
-    theme_groups = analyzer.suggest_filter_groups(categories)
+    # Sorted categories and theme groups, recomputed only when the data changes
+    categories, theme_groups, theme_previews = prepare_category_selector(df["category"])
     
     # Create UI selector
     container = st.sidebar if sidebar else st
@@ -316,13 +419,11 @@ def create_themed_category_selector(df: pd.DataFrame, sidebar=True):
                 default=["HISTORY", "SCIENCE", "ENTERTAINMENT"][:3] if len(theme_groups) > 3 else list(theme_groups.keys())[:1]
             )
             
-            # Combine all categories from selected themes
-            for theme in selected_themes:
-                if theme in theme_groups:
-                    selected_categories.extend(theme_groups[theme])
-            
-            # Remove duplicates
-            selected_categories = list(set(selected_categories))
+            # Combine all categories from selected themes, dropping
+            # duplicates but keeping theme order
+            selected_categories = list(dict.fromkeys(chain.from_iterable(
+                theme_groups[theme] for theme in selected_themes if theme in theme_groups
+            )))
             
             # Show selected category count
             if selected_categories:
@@ -333,7 +434,7 @@ def create_themed_category_selector(df: pd.DataFrame, sidebar=True):
                     for theme in selected_themes:
                         if theme in theme_groups:
                             st.write(f"**{theme}:**")
-                            st.write(", ".join(theme_groups[theme][:10]))
+                            st.write(theme_previews[theme])
                             if len(theme_groups[theme]) > 10:
                                 st.write(f"... and {len(theme_groups[theme]) - 10} more")
         
@@ -386,10 +487,9 @@ def create_themed_category_selector(df: pd.DataFrame, sidebar=True):
                 themes_to_use = []
             
             if themes_to_use:
-                for theme in themes_to_use:
-                    if theme in theme_groups:
-                        selected_categories.extend(theme_groups[theme])
-                selected_categories = list(set(selected_categories))
+                selected_categories = list(dict.fromkeys(chain.from_iterable(
+                    theme_groups[theme] for theme in themes_to_use if theme in theme_groups
+                )))
             
             st.info(f"Selected: {len(selected_categories)} categories")
     
@@ -31,16 +31,16 @@ def check_database():
         
         # Check categories
         print("\nChecking question categories...")
-        categories = db.get_categories()
-        print(f"✓ Found {len(categories)} categories")
+        category_count = db.get_category_count()
+        print(f"✓ Found {category_count} categories")
         
-        if categories:
+        if category_count:
             print("\nTop 10 categories:")
-            for cat, count in categories[:10]:
+            for cat, count in db.get_top_categories(10):
                 print(f"  - {cat}: {count} questions")
         
         # Get total question count
-        total_questions = sum(count for _, count in categories)
+        total_questions = db.get_question_count()
         print(f"\n✓ Total questions in database: {total_questions}")
         
         # Check for users
@@ -1,53 +1,87 @@
 import csv
 import json
+import re
+import sys
 
-def convert_csv_to_json():
-    """Convert the CSV file to JSON format for the data processor."""
-    questions = []
+# Fast JSON encoder, with stdlib fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# "$1,200\nanswer" -> dollar value and the answer text after it
+VALUE_ANSWER_RE = re.compile(r'^\$(\d[\d,]*)\n(.*)', re.S)
+
+def dump_question(question):
+    """Serialize one question as compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(question)
+    return json.dumps(question, ensure_ascii=False).encode('utf-8')
+
+def convert_csv_to_json(limit=1000):
+    """Convert the CSV file to JSON format for the data processor.
     
-    with open('data/all_jeopardy_clues.csv', 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+    Questions are written to the output as they are read, so memory use
+    doesn't grow with the number of rows. A limit of 0 converts the whole
+    CSV.
+    """
+    count = 0
+    
+    with open('data/all_jeopardy_clues.csv', 'r', encoding='utf-8', newline='',
+              buffering=1 << 20) as csvfile, \
+         open('data/questions_sample.json', 'wb') as jsonfile:
+        reader = csv.reader(csvfile)
+        
+        # Look up column positions once; missing columns read as ''
+        header = next(reader, [])
+        columns = {name: (header.index(name) if name in header else None)
+                   for name in ('correct_response', 'category', 'clue', 'round', 'game_id')}
+        
+        def field(row, name):
+            index = columns[name]
+            return row[index] if index is not None and index < len(row) else ''
+        
+        jsonfile.write(b'[')
         
         for i, row in enumerate(reader):
-            # Limit to first 1000 questions for testing
-            if i >= 1000:
+            # Limit to the first rows for testing
+            if limit and i >= limit:
                 break
                 
             # Extract value from the correct_response field (contains value + answer)
-            correct_response = row.get('correct_response', '').strip()
+            correct_response = field(row, 'correct_response').strip()
             value = 0
             answer = correct_response
             
-            # Try to extract value if it starts with $
-            if correct_response.startswith('$'):
-                parts = correct_response.split('\n')
-                if len(parts) >= 2:
-                    try:
-                        value = int(parts[0].replace('$', '').replace(',', ''))
-                        answer = '\n'.join(parts[1:])
-                    except:
-                        pass
+            # Split off the value if the field starts with one
+            match = VALUE_ANSWER_RE.match(correct_response)
+            if match:
+                value = int(match.group(1).replace(',', ''))
+                answer = match.group(2)
             
             question = {
-                'category': row.get('category', '').strip(),
-                'question': row.get('clue', '').strip(),
+                'category': field(row, 'category').strip(),
+                'question': field(row, 'clue').strip(),
                 'answer': answer,
                 'value': value,
-                'round': row.get('round', '').strip(),
-                'show_number': row.get('game_id', '').strip(),
+                'round': field(row, 'round').strip(),
+                'show_number': field(row, 'game_id').strip(),
                 'air_date': ''  # Not in CSV
             }
             
             # Only add if we have the essential fields
             if question['category'] and question['question'] and question['answer']:
-                questions.append(question)
-    
-    # Save to JSON file
-    with open('data/questions_sample.json', 'w', encoding='utf-8') as jsonfile:
-        json.dump(questions, jsonfile, indent=2, ensure_ascii=False)
+                # Still a JSON array, one question per line
+                jsonfile.write(b',\n' if count else b'\n')
+                jsonfile.write(dump_question(question))
+                count += 1
+        
+        jsonfile.write(b'\n]\n')
     
-    print(f"Converted {len(questions)} questions to JSON format")
+    print(f"Converted {count} questions to JSON format")
     print("Saved to data/questions_sample.json")
 
 if __name__ == "__main__":
-    convert_csv_to_json()
\ No newline at end of file
+    # Optional row limit; 0 converts every row
+    convert_csv_to_json(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -1,6 +1,9 @@
 """
 Application factory for Railway deployment.
 This ensures proper initialization order.
+
+Importing this module doesn't build the app; serve it with
+gunicorn 'create_app:create_app()'.
 """
 
 import os
@@ -23,9 +26,6 @@ def create_app():
     
     return app
 
-# Create the app instance
-app = create_app()
-
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+    create_app().run(host='0.0.0.0', port=port)
\ No newline at end of file
@@ -15,6 +15,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_YEAR_RE = re.compile(r'\b(?:1[0-9]{3}|20[0-9]{2})\b')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Common HTML entities and stray backslashes, replaced in one pass
+_ENTITY_REPLACEMENTS = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&nbsp;': ' ',
+    '\\': ''
+}
+_ENTITY_RE = re.compile('|'.join(map(re.escape, _ENTITY_REPLACEMENTS)))
+
 class JeopardyDataProcessor:
     def __init__(self, db_url: Optional[str] = None):
         self.db = JeopardyDatabase(db_url)
@@ -66,12 +82,11 @@ class JeopardyDataProcessor:
             scores['word_count'] = 9
         
         # 3. Proper noun count (indicates specific knowledge required)
-        proper_nouns = len(re.findall(r'\b[A-Z][a-z]+\b', question_text))
+        proper_nouns = len(_PROPER_NOUN_RE.findall(question_text))
         scores['proper_nouns'] = min(proper_nouns * 2, 10)
         
         # 4. Date/year presence (historical questions often harder)
-        dates = re.findall(r'\b(1[0-9]{3}|20[0-9]{2})\b', question_text)
-        scores['dates'] = 8 if dates else 4
+        scores['dates'] = 8 if _YEAR_RE.search(question_text) else 4
         
         # 5. Technical terminology score
         question_lower = question_text.lower()
@@ -109,21 +124,10 @@ class JeopardyDataProcessor:
             return ''
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         # Fix common HTML entities
-        replacements = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'",
-            '&nbsp;': ' ',
-            '\\': ''
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        text = _ENTITY_RE.sub(lambda m: _ENTITY_REPLACEMENTS[m.group()], text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
@@ -1,8 +1,9 @@
 import sqlite3
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Union, Any
+from typing import List, Dict, Optional, Set, Tuple, Union, Any
 import logging
 from urllib.parse import urlparse
 
@@ -20,6 +21,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class JeopardyDatabase:
+    # Category counts per database URL, reused for CATEGORIES_CACHE_TTL seconds
+    CATEGORIES_CACHE_TTL = 60
+    _categories_cache: Dict[str, Tuple[float, List[Tuple[str, int]]]] = {}
+    
     def __init__(self, db_url: Optional[str] = None):
         """
         Initialize database connection.
@@ -282,9 +287,50 @@ class JeopardyDatabase:
                     CREATE INDEX IF NOT EXISTS idx_progress_timestamp ON user_progress(timestamp);
                 ''')
                 conn.commit()
+            
+            self._ensure_comprehensive_index(conn)
                 
             logger.info("Database initialized successfully")
     
+    def _ensure_comprehensive_index(self, conn):
+        """Make comprehensive questions (show 99999) unique per category and question.
+        
+        Older loaders appended the whole set on every run, so duplicates are
+        merged into the lowest id first, moving any progress that points at them.
+        """
+        if self.db_type == 'postgresql':
+            exists_query = "SELECT 1 FROM pg_indexes WHERE indexname = 'ux_questions_cat_q'"
+        else:
+            exists_query = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'ux_questions_cat_q'"
+        if self._execute_select(conn, exists_query):
+            return
+        
+        duplicate_ids = '''SELECT id FROM questions
+                           WHERE show_number = 99999 AND id NOT IN (
+                               SELECT MIN(id) FROM questions
+                               WHERE show_number = 99999
+                               GROUP BY category, question)'''
+        queries = [
+            f'''UPDATE user_progress SET question_id = (
+                    SELECT MIN(kept.id) FROM questions kept, questions dup
+                    WHERE dup.id = user_progress.question_id
+                      AND kept.show_number = 99999
+                      AND kept.category = dup.category
+                      AND kept.question = dup.question)
+                WHERE question_id IN ({duplicate_ids})''',
+            f'DELETE FROM questions WHERE id IN ({duplicate_ids})',
+            '''CREATE UNIQUE INDEX IF NOT EXISTS ux_questions_cat_q
+               ON questions(category, question) WHERE show_number = 99999'''
+        ]
+        
+        cursor = conn.cursor()
+        for query in queries:
+            cursor.execute(query)
+            if query.startswith('DELETE') and cursor.rowcount > 0:
+                logger.info(f"Removed {cursor.rowcount} duplicate comprehensive questions")
+        cursor.close()
+        conn.commit()
+    
     # Question Management
     
     def load_questions_from_json(self, json_file_path: str) -> int:
@@ -344,6 +390,7 @@ class JeopardyDatabase:
                             count += 1
                 
                 conn.commit()
+                self.clear_category_cache()
                 logger.info(f"Loaded {count} new questions from {json_file_path}")
                 return count
                 
@@ -418,14 +465,43 @@ class JeopardyDatabase:
     
     def get_categories(self) -> List[Tuple[str, int]]:
         """Get all categories with question counts."""
+        cached = self._categories_cache.get(self.db_url)
+        if cached and time.monotonic() - cached[0] < self.CATEGORIES_CACHE_TTL:
+            return list(cached[1])
+        
         with self.get_connection() as conn:
             query = '''SELECT category, COUNT(*) as count 
                       FROM questions 
                       GROUP BY category 
                       ORDER BY count DESC'''
             results = self._execute_select(conn, query)
+            categories = [(row['category'], row['count']) for row in results]
+        
+        self._categories_cache[self.db_url] = (time.monotonic(), categories)
+        return list(categories)
+    
+    def clear_category_cache(self):
+        """Drop cached category counts after questions are added."""
+        self._categories_cache.pop(self.db_url, None)
+    
+    def get_top_categories(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """Get the categories with the most questions."""
+        with self.get_connection() as conn:
+            query = '''SELECT category, COUNT(*) as count 
+                      FROM questions 
+                      GROUP BY category 
+                      ORDER BY count DESC 
+                      LIMIT ?'''
+            results = self._execute_select(conn, query, (limit,))
             return [(row['category'], row['count']) for row in results]
     
+    def get_category_count(self) -> int:
+        """Get the number of distinct categories."""
+        with self.get_connection() as conn:
+            query = 'SELECT COUNT(DISTINCT category) as count FROM questions'
+            result = self._execute_select(conn, query)
+            return result[0]['count'] if result else 0
+    
     # User Authentication Management
     
     def create_user(self, username: str, email: str, password_hash: str) -> Optional[int]:
@@ -455,6 +531,19 @@ class JeopardyDatabase:
             results = self._execute_select(conn, query, (email,))
             return results[0] if results else None
     
+    def get_user_conflicts(self, username: str, email: str) -> Set[str]:
+        """Return which of username/email are already taken, in one query."""
+        with self.get_connection() as conn:
+            query = 'SELECT username, email FROM users WHERE username = ? OR email = ?'
+            results = self._execute_select(conn, query, (username, email))
+            conflicts = set()
+            for row in results:
+                if row['username'] == username:
+                    conflicts.add('username')
+                if row['email'] == email:
+                    conflicts.add('email')
+            return conflicts
+    
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Get user by ID."""
         with self.get_connection() as conn: